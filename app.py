@@ -2,45 +2,225 @@ import streamlit as st
 import google.generativeai as genai
 from dotenv import load_dotenv
 import os
+import hashlib
+import time
+from collections import OrderedDict
 import yaml
-import json
-import re
+
+from dockerfile_parser import is_dockerfile, parse_dockerfile
+from scan_prompts import SCAN_PROMPT_PREFIX, build_batch_scan_prompt, split_batch_reports
 
 # Load environment variables and configure Gemini
 load_dotenv()
 GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
 
+# Finished Gemini responses are kept for an hour, up to 128 entries
+RESPONSE_CACHE_TTL = 3600
+RESPONSE_CACHE_MAX_ENTRIES = 128
+
+# Reports are also remembered per session, for sessions that outlive the TTL
+SESSION_REPORTS_MAX_ENTRIES = 32
+
+# Larger multi-file batches give diminishing returns per request
+MAX_BATCH_FILES = 5
+
+# Batch jobs in these states are finished without results
+BATCH_FAILED_STATES = ("JOB_STATE_FAILED", "JOB_STATE_CANCELLED", "JOB_STATE_EXPIRED")
+
 if not GEMINI_API_KEY:
     st.error("Please set your Google Gemini API key.")
     st.stop()
 
-genai.configure(api_key=GEMINI_API_KEY)
+
+@st.cache_resource
+def get_model(name):
+    """
+    Configure the Gemini SDK and build the model client once per process,
+    so Streamlit reruns reuse it instead of reinitializing it on every click.
+    """
+    genai.configure(api_key=GEMINI_API_KEY)
+    return genai.GenerativeModel(name)
+
+
+def content_key(file_content):
+    """
+    Return a short digest of the file content, used as the cache key
+    so the caches are not keyed on the full (possibly multi-MB) text.
+    """
+    return hashlib.blake2b(file_content.encode("utf-8"), digest_size=16).hexdigest()
+
+
+@st.cache_resource
+def _response_cache():
+    """
+    Process-wide store of finished Gemini responses, keyed by content hash.
+    Streamed responses can't go through st.cache_data, so they are
+    stored here once fully received.
+    """
+    return OrderedDict()
+
+
+def _get_cached_response(key):
+    cache = _response_cache()
+    entry = cache.get(key)
+    if entry is None:
+        return None
+    stored_at, response_text = entry
+    if time.monotonic() - stored_at > RESPONSE_CACHE_TTL:
+        cache.pop(key, None)
+        return None
+    return response_text
+
+
+def _store_response(key, response_text):
+    cache = _response_cache()
+    cache.pop(key, None)
+    cache[key] = (time.monotonic(), response_text)
+    while len(cache) > RESPONSE_CACHE_MAX_ENTRIES:
+        cache.popitem(last=False)
+
+
+def _get_report(key):
+    """
+    Look up a finished report, first in this session's results and then
+    in the process-wide cache.
+    """
+    results = st.session_state.setdefault('scan_results', OrderedDict())
+    if key in results:
+        results.move_to_end(key)
+        return results[key]
+    report = _get_cached_response(key)
+    if report is not None:
+        _remember_report(key, report, cache=False)
+    return report
+
+
+def _remember_report(key, report, cache=True):
+    results = st.session_state.setdefault('scan_results', OrderedDict())
+    results[key] = report
+    results.move_to_end(key)
+    while len(results) > SESSION_REPORTS_MAX_ENTRIES:
+        results.popitem(last=False)
+    if cache:
+        _store_response(key, report)
+
 
 # Function to analyze with Gemini
 def analyze_with_gemini(file_content):
     """
     Analyze the given DevOps configuration file for misconfigurations
     and provide remediation suggestions using Google Gemini.
+    Returns an iterable of report text chunks, streamed as Gemini
+    produces them; a cached report comes back as a single chunk.
     """
+    key = content_key(file_content)
+    report = _get_report(key)
+    if report is not None:
+        return [report]
+    return _stream_analysis(key, file_content)
+
+
+def _stream_analysis(key, file_content):
+    chunks = []
     try:
-        prompt = f"""
-        You are an AI DevOps assistant. Analyze the following configuration file for misconfigurations, 
-        vulnerabilities, and best practice violations. Provide a detailed report of issues and actionable remediation steps.
-
-        Configuration File:
-        {file_content}
-        """
-        model = genai.GenerativeModel("gemini-1.5-flash")
-        result = model.generate_content([prompt])
-        return result.text
+        model = get_model("gemini-1.5-flash")
+        for chunk in model.generate_content([SCAN_PROMPT_PREFIX + file_content], stream=True):
+            chunks.append(chunk.text)
+            yield chunk.text
     except Exception as e:
-        return f"Error: {str(e)}"
+        # Errors are shown to the user but never cached
+        yield f"Error: {str(e)}"
+        return
+    _remember_report(key, "".join(chunks))
+
+
+def analyze_batch_with_gemini(files):
+    """
+    Analyze several configuration files, packing up to MAX_BATCH_FILES of
+    them into each Gemini request. Takes (file_name, file_content) pairs and
+    returns one report per file, in order. Reports share the single-file cache.
+    """
+    keys = [content_key(content) for _, content in files]
+    reports = [_get_report(key) for key in keys]
+    pending = [i for i, report in enumerate(reports) if report is None]
+    model = get_model("gemini-1.5-flash")
+    for start in range(0, len(pending), MAX_BATCH_FILES):
+        batch = pending[start:start + MAX_BATCH_FILES]
+        try:
+            result = model.generate_content([build_batch_scan_prompt([files[i] for i in batch])])
+            batch_reports = split_batch_reports(result.text, len(batch))
+        except Exception as e:
+            for i in batch:
+                reports[i] = f"Error: {str(e)}"
+            continue
+        for i, report in zip(batch, batch_reports):
+            reports[i] = report
+            _remember_report(keys[i], report)
+    return reports
+
+
+@st.cache_resource
+def get_batch_client():
+    """
+    Build the client for the Gemini Batch API, which is only exposed
+    through the google-genai SDK. The SDK is imported here so that it is
+    only loaded once batch mode is actually used.
+    """
+    from google import genai as genai_sdk
+    return genai_sdk.Client(api_key=GEMINI_API_KEY)
+
+
+def submit_batch_scan(files):
+    """
+    Submit a scan of (file_name, file_content) pairs through the Gemini
+    Batch API, which is cheaper but may take up to 24 hours to complete.
+    Returns the batch job name.
+    """
+    requests = [
+        {"contents": [{"role": "user", "parts": [{"text": SCAN_PROMPT_PREFIX + content}]}]}
+        for _, content in files
+    ]
+    job = get_batch_client().batches.create(
+        model="gemini-1.5-flash",
+        src=requests,
+        config={"display_name": "devops-guardian-scan"},
+    )
+    return job.name
+
+
+def get_batch_scan(job_name):
+    """
+    Poll a batch scan job. Returns (state, reports), where reports holds
+    one report per submitted file once the job has succeeded, else None.
+    Jobs in BATCH_FAILED_STATES will never produce reports.
+    """
+    job = get_batch_client().batches.get(name=job_name)
+    state = job.state.name
+    if state != "JOB_STATE_SUCCEEDED":
+        return state, None
+    reports = []
+    for inlined in job.dest.inlined_responses:
+        # Blocked responses (e.g. by safety filters) carry no text
+        text = inlined.response.text if inlined.response else None
+        if text is None:
+            reports.append(f"Error: {inlined.error or 'no report was returned for this file'}")
+        else:
+            reports.append(text)
+    return state, reports
+
+
+# Use libyaml's C emitter when PyYAML was built with it
+_YamlDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+
+def _dump_yaml(manifest):
+    return yaml.dump(manifest, Dumper=_YamlDumper, sort_keys=False, default_flow_style=False)
 
 
 # Function to generate Kubernetes Deployment YAML from a Dockerfile
-def generate_deployment_yaml(image_name, dockerfile_config=None, gemini_suggestions=None):
+def generate_deployment_yaml(image_name, dockerfile_config=None):
     """
-    Generate a Kubernetes deployment file using Dockerfile analysis and Gemini suggestions.
+    Generate a Kubernetes deployment file using Dockerfile analysis.
     """
     if dockerfile_config is None:
         dockerfile_config = {}
@@ -48,9 +228,8 @@ def generate_deployment_yaml(image_name, dockerfile_config=None, gemini_suggesti
     # Extract configuration from Dockerfile analysis
     ports = dockerfile_config.get('ports', [80])
     env_vars = dockerfile_config.get('env_vars', [])
-    volumes = dockerfile_config.get('volumes', [])
-    resources = dockerfile_config.get('resources', {})
     command = dockerfile_config.get('command', None)
+    args = dockerfile_config.get('args', None)
     
     container_spec = {
         'name': image_name,
@@ -62,35 +241,27 @@ def generate_deployment_yaml(image_name, dockerfile_config=None, gemini_suggesti
     if env_vars:
         container_spec['env'] = [{'name': env['name'], 'value': env['value']} for env in env_vars]
     
-    # Add command if present
+    # Add command (the image ENTRYPOINT) and args (its CMD) if present
     if command:
         container_spec['command'] = command if isinstance(command, list) else [command]
+    if args:
+        container_spec['args'] = args if isinstance(args, list) else [args]
     
-    # Add security recommendations from Gemini (if any)
-    if gemini_suggestions:
-        container_spec['securityContext'] = gemini_suggestions.get('securityContext', {})
-    
-    container_spec_str = ''.join(f'        {k}: {v}\n' for k, v in container_spec.items())
-    
-    deployment_yaml = f"""
-apiVersion: apps/v1
-kind: Deployment
-metadata:
-  name: {image_name}-deployment
-spec:
-  replicas: 1
-  selector:
-    matchLabels:
-      app: {image_name}
-  template:
-    metadata:
-      labels:
-        app: {image_name}
-    spec:
-      containers:
-      - {container_spec_str}"""
+    manifest = {
+        'apiVersion': 'apps/v1',
+        'kind': 'Deployment',
+        'metadata': {'name': f'{image_name}-deployment'},
+        'spec': {
+            'replicas': 1,
+            'selector': {'matchLabels': {'app': image_name}},
+            'template': {
+                'metadata': {'labels': {'app': image_name}},
+                'spec': {'containers': [container_spec]},
+            },
+        },
+    }
     
-    return deployment_yaml
+    return _dump_yaml(manifest)
 
 
 # Function to generate Kubernetes Service YAML from a Dockerfile
@@ -103,21 +274,18 @@ def generate_service_yaml(image_name, dockerfile_config=None):
     
     ports = dockerfile_config.get('ports', [80])
     
-    ports_spec = '\n'.join(f'    - protocol: TCP\n      port: {port}\n      targetPort: {port}' for port in ports)
-    
-    service_yaml = f"""
-apiVersion: v1
-kind: Service
-metadata:
-  name: {image_name}-service
-spec:
-  selector:
-    app: {image_name}
-  ports:
-{ports_spec}
-  type: ClusterIP"""
+    manifest = {
+        'apiVersion': 'v1',
+        'kind': 'Service',
+        'metadata': {'name': f'{image_name}-service'},
+        'spec': {
+            'selector': {'app': image_name},
+            'ports': [{'protocol': 'TCP', 'port': port, 'targetPort': port} for port in ports],
+            'type': 'ClusterIP',
+        },
+    }
     
-    return service_yaml
+    return _dump_yaml(manifest)
 
 
 # Function to generate Kubernetes Ingress YAML from a Dockerfile
@@ -125,74 +293,63 @@ def generate_ingress_yaml(image_name, host_name):
     """
     Generate a basic Kubernetes ingress file.
     """
-    ingress_yaml = f"""
-apiVersion: networking.k8s.io/v1
-kind: Ingress
-metadata:
-  name: {image_name}-ingress
-spec:
-  rules:
-  - host: {host_name}
-    http:
-      paths:
-      - path: / 
-        pathType: Prefix
-        backend:
-          service:
-            name: {image_name}-service
-            port:
-              number: 80
-    """
-    return ingress_yaml
-
+    manifest = {
+        'apiVersion': 'networking.k8s.io/v1',
+        'kind': 'Ingress',
+        'metadata': {'name': f'{image_name}-ingress'},
+        'spec': {
+            'rules': [{
+                'host': host_name,
+                'http': {
+                    'paths': [{
+                        'path': '/',
+                        'pathType': 'Prefix',
+                        'backend': {
+                            'service': {
+                                'name': f'{image_name}-service',
+                                'port': {'number': 80},
+                            },
+                        },
+                    }],
+                },
+            }],
+        },
+    }
+    
+    return _dump_yaml(manifest)
 
-def analyze_dockerfile(file_content):
-    model = genai.GenerativeModel('gemini-pro')
-    prompt = f"""
-    You’re a skilled DevOps engineer with extensive experience in containerization technologies, particularly Docker. You have a deep understanding of Dockerfiles and their configuration settings, and you can extract relevant information in a structured manner.
 
-Your task is to analyze the following Dockerfile and extract all configuration details in JSON format. Here is the Dockerfile content that you need to analyze:
-    {file_content}
-    
-    Return a JSON object with these fields:
-    - base_image: The base image used
-    - ports: List of exposed ports
-    - env_vars: List of environment variables
-    - volumes: List of volumes
-    - command: Default command or entrypoint
-    - resources: Any resource specifications found
+def render_manifests(image_name, host_name, dockerfile_config=None):
     """
-    response = model.generate_content(prompt)
-    try:
-        # Store the raw analysis for display
-        st.session_state.raw_analysis = response.text
-        # Try to extract structured data from the response
-        json_match = re.search(r'```json\n(.*?)\n```', response.text, re.DOTALL)
-        if json_match:
-            return json.loads(json_match.group(1))
-        # If no backticks, try parsing the entire response
-        return json.loads(response.text)
-    except Exception as e:
-        st.error(f"Failed to parse Dockerfile analysis: {str(e)}")
-        return {}
+    Render the deployment, service and ingress files once for the given
+    settings. Each is returned as a (yaml, bytes) pair: the text for display
+    and its UTF-8 encoding for download, so reruns only read them back.
+    """
+    manifests = (
+        generate_deployment_yaml(image_name, dockerfile_config),
+        generate_service_yaml(image_name, dockerfile_config),
+        generate_ingress_yaml(image_name, host_name),
+    )
+    return tuple((manifest, manifest.encode('utf-8')) for manifest in manifests)
 
 
-def is_dockerfile(file_name, file_content):
+def read_uploaded_files(uploaded_files, state_key):
     """
-    A simple check to verify if the uploaded file is a Dockerfile.
-    This checks the file name and a few initial lines of the file content.
+    Return the decoded text of each uploaded file. Decoded contents are
+    kept in session_state under state_key, keyed by the upload's file_id,
+    so Streamlit reruns don't decode the same upload again.
     """
-    # Check if the file name is 'Dockerfile'
-    if file_name.lower() != "dockerfile":
-        return False
-    
-    # Check if the content includes Dockerfile-specific instructions
-    dockerfile_keywords = ['FROM', 'RUN', 'CMD', 'ENTRYPOINT', 'EXPOSE', 'COPY', 'ADD']
-    for keyword in dockerfile_keywords:
-        if keyword in file_content:
-            return True
-    
-    return False
+    cached = st.session_state.get(state_key, {})
+    contents = {}
+    for uploaded_file in uploaded_files:
+        file_id = uploaded_file.file_id
+        if file_id in cached:
+            contents[file_id] = cached[file_id]
+        else:
+            contents[file_id] = uploaded_file.getvalue().decode("utf-8-sig", errors="replace")
+    # Only the current uploads are kept, so removed files are dropped
+    st.session_state[state_key] = contents
+    return [contents[uploaded_file.file_id] for uploaded_file in uploaded_files]
 
 
 # Main App
@@ -215,29 +372,116 @@ if tool_option == "🔒 AI-DevOps Guardian":
     - Actionable remediation suggestions
     """)
     
-    uploaded_file = st.file_uploader(
-        "Upload a DevOps configuration file",
+    uploaded_files = st.file_uploader(
+        "Upload DevOps configuration files",
         type=None,
+        accept_multiple_files=True,
         key="guardian_uploader"
     )
 
-    if uploaded_file:
-        file_name = uploaded_file.name
-        file_content = uploaded_file.read().decode("utf-8")
+    if uploaded_files:
+        supported_files = []
+        for uploaded_file in uploaded_files:
+            file_name = uploaded_file.name
+            if file_name == "Dockerfile" or file_name.endswith((".yaml", ".yml", ".json", ".tf", ".ini", ".conf")):
+                supported_files.append(uploaded_file)
+            else:
+                st.error(f"Unsupported file type: {file_name}. Please upload a valid DevOps configuration file.")
+        files = list(zip(
+            [uploaded_file.name for uploaded_file in supported_files],
+            read_uploaded_files(supported_files, 'guardian_contents'),
+        ))
 
-        if file_name == "Dockerfile" or file_name.endswith((".yaml", ".yml", ".json", ".tf", ".ini", ".conf")):
+        if files:
             st.subheader("Uploaded File Content")
-            st.code(file_content, language="plaintext")
+            for file_name, file_content in files:
+                if len(files) > 1:
+                    st.write(f"**{file_name}**")
+                st.code(file_content, language="plaintext")
+
+            batch_mode = st.checkbox("Batch mode (cheaper, up to 24h)")
 
             if st.button("🔍 Scan for Misconfigurations"):
-                with st.spinner("Analyzing with AI-DevOps Guardian..."):
-                    analysis_result = analyze_with_gemini(file_content)
-                    if analysis_result:
-                        st.success("Analysis Complete!")
-                        st.subheader("🛠️ Misconfiguration Report")
-                        st.write(analysis_result)
+                if batch_mode:
+                    # Files that already have a report aren't submitted again
+                    pending = []
+                    for file_name, file_content in files:
+                        report = _get_report(content_key(file_content))
+                        if report is None:
+                            pending.append((file_name, file_content))
+                        else:
+                            st.subheader(f"🛠️ Misconfiguration Report: {file_name}")
+                            st.markdown(report)
+                    if pending:
+                        try:
+                            job_name = submit_batch_scan(pending)
+                        except Exception as e:
+                            st.error(f"Failed to submit batch job: {str(e)}")
+                        else:
+                            st.session_state.setdefault('batch_jobs', []).append({
+                                'name': job_name,
+                                'files': [file_name for file_name, _ in pending],
+                                'keys': [content_key(file_content) for _, file_content in pending],
+                            })
+                            st.info(
+                                f"Batch job submitted: {job_name}. "
+                                "Keep this name to check the job from a later session."
+                            )
+                elif len(files) == 1:
+                    st.subheader("🛠️ Misconfiguration Report")
+                    placeholder = st.empty()
+                    with st.spinner("Analyzing with AI-DevOps Guardian..."):
+                        buf = []
+                        for chunk in analyze_with_gemini(files[0][1]):
+                            buf.append(chunk)
+                            placeholder.markdown("".join(buf))
+                else:
+                    with st.spinner("Analyzing with AI-DevOps Guardian..."):
+                        reports = analyze_batch_with_gemini(files)
+                    for (file_name, _), report in zip(files, reports):
+                        st.subheader(f"🛠️ Misconfiguration Report: {file_name}")
+                        st.markdown(report)
+                if not batch_mode:
+                    st.success("Analysis Complete!")
+
+    batch_jobs = st.session_state.setdefault('batch_jobs', [])
+    with st.expander("📦 Check a batch scan by job name"):
+        # Jobs can outlive the session that submitted them
+        tracked_name = st.text_input("Batch job name", placeholder="batches/...")
+        if st.button("Track job") and tracked_name:
+            if all(job['name'] != tracked_name for job in batch_jobs):
+                batch_jobs.append({'name': tracked_name, 'files': None, 'keys': None})
+    if batch_jobs:
+        st.subheader("📦 Batch Scans")
+    for job in batch_jobs:
+        if job['files']:
+            st.write(f"**{job['name']}** ({', '.join(job['files'])})")
         else:
-            st.error("Unsupported file type. Please upload a valid DevOps configuration file.")
+            st.write(f"**{job['name']}**")
+        finished = 'reports' in job or job.get('state') in BATCH_FAILED_STATES
+        if not finished and st.button("Check status", key=f"check_{job['name']}"):
+            try:
+                state, reports = get_batch_scan(job['name'])
+            except Exception as e:
+                st.error(f"Failed to check batch job: {str(e)}")
+            else:
+                if state in BATCH_FAILED_STATES:
+                    job['state'] = state
+                elif reports is None:
+                    st.info(f"Job state: {state}")
+                else:
+                    job['reports'] = reports
+                    # File contents are only known for jobs submitted in this session
+                    for key, report in zip(job['keys'] or [], reports):
+                        if not report.startswith("Error:"):
+                            _remember_report(key, report)
+        if job.get('state') in BATCH_FAILED_STATES:
+            st.error(f"Batch job ended without results: {job['state']}")
+        if 'reports' in job:
+            file_names = job['files'] or [f"File {i + 1}" for i in range(len(job['reports']))]
+            for file_name, report in zip(file_names, job['reports']):
+                with st.expander(f"🛠️ Misconfiguration Report: {file_name}"):
+                    st.markdown(report)
 
 elif tool_option == "⚙️ Kubernetes YAML Generator":
     st.header("Kubernetes YAML Generator")
@@ -258,18 +502,25 @@ elif tool_option == "⚙️ Kubernetes YAML Generator":
         )
         
         if uploaded_file:
-            file_content = uploaded_file.read().decode("utf-8")
+            file_bytes = uploaded_file.getvalue()
             
             # Validate if it's a Dockerfile
-            if is_dockerfile(uploaded_file.name, file_content):
+            if is_dockerfile(uploaded_file.name, file_bytes):
+                file_content = read_uploaded_files([uploaded_file], 'dockerfile_contents')[0]
                 st.success("✅ Valid Dockerfile detected")
                 st.write("#### Dockerfile Contents:")
                 st.code(file_content, language="dockerfile")
                 
                 if st.button("Analyze Dockerfile"):
                     with st.spinner("Analyzing Dockerfile..."):
-                        analysis = analyze_dockerfile(file_content)
-                        st.session_state.dockerfile_analysis = analysis
+                        analysis = parse_dockerfile(file_content)
+                        # Keep only what the YAML generators consume; session_state persists across reruns
+                        st.session_state.dockerfile_analysis = {
+                            k: analysis[k] for k in ('ports', 'env_vars', 'command', 'args')
+                            if k in analysis
+                        }
+                        # The decoded upload is only needed in this step
+                        st.session_state.pop('dockerfile_contents', None)
                         st.session_state.k8s_step = 2
                         st.rerun()
             else:
@@ -302,7 +553,8 @@ elif tool_option == "⚙️ Kubernetes YAML Generator":
         if st.button("Generate Kubernetes Files"):
             if image_name and host_name:
                 st.session_state.image_name = image_name
-                st.session_state.host_name = host_name
+                dockerfile_config = st.session_state.get('dockerfile_analysis', {})
+                st.session_state.k8s_manifests = render_manifests(image_name, host_name, dockerfile_config)
                 st.session_state.k8s_step = 3
                 st.rerun()
             else:
@@ -313,16 +565,13 @@ elif tool_option == "⚙️ Kubernetes YAML Generator":
         st.write("### Step 3: Generated Kubernetes Files")
         
         image_name = st.session_state.image_name
-        host_name = st.session_state.host_name
-        dockerfile_config = st.session_state.get('dockerfile_analysis', {})
-        
-        # Generate YAML files using Dockerfile configuration
-        gemini_suggestions = dockerfile_config.get('security_recommendations', {})
         
-        # Generate YAML files
-        deployment_yaml = generate_deployment_yaml(image_name, dockerfile_config, gemini_suggestions)
-        service_yaml = generate_service_yaml(image_name, dockerfile_config)
-        ingress_yaml = generate_ingress_yaml(image_name, host_name)
+        # YAML files were rendered and encoded once when the settings were submitted
+        (
+            (deployment_yaml, deployment_bytes),
+            (service_yaml, service_bytes),
+            (ingress_yaml, ingress_bytes),
+        ) = st.session_state.k8s_manifests
         
         # Display YAML Files
         st.subheader("Kubernetes Deployment YAML")
@@ -336,27 +585,29 @@ elif tool_option == "⚙️ Kubernetes YAML Generator":
         
         st.download_button(
             "⬇️ Download Deployment YAML",
-            deployment_yaml,
+            deployment_bytes,
             file_name=f"{image_name}-deployment.yaml",
             mime="text/yaml"
         )
         
         st.download_button(
             "⬇️ Download Service YAML",
-            service_yaml,
+            service_bytes,
             file_name=f"{image_name}-service.yaml",
             mime="text/yaml"
         )
         
         st.download_button(
             "⬇️ Download Ingress YAML",
-            ingress_yaml,
+            ingress_bytes,
             file_name=f"{image_name}-ingress.yaml",
             mime="text/yaml"
         )
         
         # Option to restart
         if st.button("🔄 Start Over"):
+            for key in ('dockerfile_analysis', 'image_name', 'k8s_manifests'):
+                st.session_state.pop(key, None)
             st.session_state.k8s_step = 1
             st.rerun()
 
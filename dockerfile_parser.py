@@ -0,0 +1,155 @@
+import copy
+import json
+import re
+import shlex
+
+
+_LINE_CONTINUATION_RE = re.compile(r'\\[ \t]*\r?\n')
+
+
+# Dockerfile instructions are case-insensitive and start a line; the
+# file itself may start with a UTF-8 byte order mark
+DOCKERFILE_RE = re.compile(rb'(?mi)^(?:\xef\xbb\xbf)?\s*(FROM|RUN|CMD|ENTRYPOINT|COPY|ADD|ENV|WORKDIR|EXPOSE)\b')
+
+
+def is_dockerfile(file_name, file_bytes):
+    """
+    A simple check to verify if the uploaded file is a Dockerfile.
+    This checks the file name and looks for a line starting with a
+    Dockerfile instruction in the raw (undecoded) file content.
+    """
+    # Check if the file name is 'Dockerfile'
+    if file_name.lower() != "dockerfile":
+        return False
+
+    # Check if the content includes Dockerfile-specific instructions
+    return DOCKERFILE_RE.search(file_bytes) is not None
+
+
+def _parse_instruction_args(args):
+    """
+    Split instruction arguments given in either exec form (a JSON array)
+    or shell form. Returns (tokens, is_exec_form).
+    """
+    if args.startswith('['):
+        try:
+            return [str(token) for token in json.loads(args)], True
+        except ValueError:
+            pass
+    return args.split(), False
+
+
+def _parse_env(args):
+    # ENV key=value [key=value ...] or the legacy ENV key value
+    first = args.split(None, 1)
+    if first and '=' not in first[0]:
+        return [{'name': first[0], 'value': first[1] if len(first) > 1 else ''}]
+    try:
+        tokens = shlex.split(args)
+    except ValueError:
+        tokens = args.split()
+    return [
+        {'name': name, 'value': value}
+        for name, _, value in (token.partition('=') for token in tokens)
+    ]
+
+
+def _parse_command(args):
+    """
+    Parse CMD/ENTRYPOINT arguments. Returns (command, is_exec_form).
+    """
+    tokens, is_exec_form = _parse_instruction_args(args)
+    if is_exec_form:
+        return tokens, True
+    # Shell form runs through /bin/sh -c, same as Docker does
+    return (['/bin/sh', '-c', args] if args else []), False
+
+
+def _new_stage(base_image):
+    return {
+        'base_image': base_image,
+        'env_vars': [],
+        'volumes': [],
+        'ports': [],
+        'cmd': None,
+        'cmd_inherited': False,
+        'entrypoint': None,
+        'entrypoint_is_exec': False,
+    }
+
+
+def parse_dockerfile(file_content):
+    """
+    Extract the Dockerfile configuration used for the Kubernetes files
+    (base image, exposed ports, env vars, volumes, command and args) locally.
+    ENTRYPOINT maps to the container 'command' and CMD to 'args', so an
+    image's own entrypoint is kept when the Dockerfile only sets CMD.
+    Only the final build stage is considered, since that's the one that
+    runs, along with anything it inherits from earlier named stages.
+    'ports' is only set when the Dockerfile exposes any.
+    """
+    stage = _new_stage(None)
+    # Stages named with FROM ... AS <name>, which later stages can build on
+    stages = {}
+
+    # Docker drops comment lines before joining continuations, including
+    # comments in the middle of a continued instruction
+    lines = [line for line in file_content.splitlines() if not line.lstrip().startswith('#')]
+
+    # Join line continuations so each instruction is a single line
+    for line in _LINE_CONTINUATION_RE.sub(' ', '\n'.join(lines)).splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        parts = line.split(None, 1)
+        instruction = parts[0].upper()
+        args = parts[1] if len(parts) > 1 else ''
+
+        if instruction == 'FROM':
+            tokens = [token for token in args.split() if not token.startswith('--')]
+            image = tokens[0] if tokens else None
+            parent = stages.get(image.lower()) if image else None
+            if parent is not None:
+                # FROM <earlier stage> inherits that stage's configuration
+                stage = copy.deepcopy(parent)
+                stage['cmd_inherited'] = True
+            else:
+                stage = _new_stage(image)
+            if len(tokens) >= 3 and tokens[1].upper() == 'AS':
+                # Stage names are case-insensitive
+                stages[tokens[2].lower()] = stage
+        elif instruction == 'EXPOSE':
+            for token in args.split():
+                port = token.split('/')[0]
+                if port.isdigit() and int(port) not in stage['ports']:
+                    stage['ports'].append(int(port))
+        elif instruction == 'ENV':
+            for env in _parse_env(args):
+                # A redefined variable replaces the earlier value
+                stage['env_vars'] = [e for e in stage['env_vars'] if e['name'] != env['name']]
+                stage['env_vars'].append(env)
+        elif instruction == 'VOLUME':
+            stage['volumes'].extend(_parse_instruction_args(args)[0])
+        elif instruction == 'CMD':
+            stage['cmd'] = _parse_command(args)[0]
+            stage['cmd_inherited'] = False
+        elif instruction == 'ENTRYPOINT':
+            stage['entrypoint'], stage['entrypoint_is_exec'] = _parse_command(args)
+            # Setting ENTRYPOINT resets a CMD inherited from the parent stage
+            if stage['cmd_inherited']:
+                stage['cmd'] = None
+
+    config = {
+        'base_image': stage['base_image'],
+        'env_vars': stage['env_vars'],
+        'volumes': stage['volumes'],
+        'command': stage['entrypoint'] or None,
+        'args': stage['cmd'] or None,
+    }
+    if stage['ports']:
+        config['ports'] = stage['ports']
+    if stage['entrypoint'] and not stage['entrypoint_is_exec']:
+        # A shell-form ENTRYPOINT ignores CMD, as in Docker
+        config['args'] = None
+
+    return config
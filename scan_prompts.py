@@ -0,0 +1,53 @@
+import re
+
+
+# Prompts are a constant prefix followed by the file content, so the
+# prefix is byte-identical across requests and can hit Gemini's prefix cache
+SCAN_PROMPT_PREFIX = (
+    "You are an AI DevOps assistant. Analyze the following configuration file for misconfigurations, "
+    "vulnerabilities, and best practice violations. Provide a detailed report of issues and actionable remediation steps.\n\n"
+    "Configuration File:\n"
+)
+BATCH_SCAN_PROMPT_PREFIX = (
+    "You are an AI DevOps assistant. Analyze each of the following configuration files for misconfigurations, "
+    "vulnerabilities, and best practice violations. Provide a detailed report of issues and actionable remediation steps for each file.\n"
+    "Return one report per file, in the same order, each starting with a line ===REPORT i=== where i is the file's number.\n\n"
+    "Configuration Files:\n"
+)
+
+
+def build_batch_scan_prompt(files):
+    """
+    Build one prompt covering several (file_name, file_content) pairs,
+    each introduced by a ===FILE i: name=== line.
+    """
+    return BATCH_SCAN_PROMPT_PREFIX + "\n".join(
+        f"===FILE {i}: {name}===\n{content}" for i, (name, content) in enumerate(files)
+    )
+
+
+_REPORT_DELIMITER_RE = re.compile(r'===REPORT (\d+)===')
+
+
+def split_batch_reports(text, count):
+    """
+    Split a batch response into one report per file, assigning each
+    ===REPORT i=== section to file i. Raises ValueError when a report is
+    missing, duplicated or out of range.
+    """
+    # A single-file batch may come back without any delimiter at all
+    if text.find('===REPORT') == -1:
+        if count == 1:
+            return [text.strip()]
+        raise ValueError(f"Expected {count} reports in batch response, got none")
+    # The split alternates preamble, index, report, index, report, ...
+    parts = _REPORT_DELIMITER_RE.split(text)
+    reports = {}
+    for index, report in zip(parts[1::2], parts[2::2]):
+        index = int(index)
+        if index in reports or not 0 <= index < count:
+            raise ValueError(f"Unexpected or duplicate report {index} in batch response")
+        reports[index] = report.strip()
+    if len(reports) != count:
+        raise ValueError(f"Expected {count} reports in batch response, got {len(reports)}")
+    return [reports[i] for i in range(count)]
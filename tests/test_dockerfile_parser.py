@@ -0,0 +1,141 @@
+from dockerfile_parser import is_dockerfile, parse_dockerfile
+
+
+def test_exec_form_and_ports():
+    config = parse_dockerfile(
+        'FROM python:3.9-slim\n'
+        'EXPOSE 8501\n'
+        'CMD ["streamlit", "run", "app.py"]\n'
+    )
+    assert config['base_image'] == 'python:3.9-slim'
+    assert config['ports'] == [8501]
+    assert config['command'] is None
+    assert config['args'] == ['streamlit', 'run', 'app.py']
+
+
+def test_no_expose_leaves_ports_unset():
+    assert 'ports' not in parse_dockerfile('FROM alpine\nCMD echo hi\n')
+
+
+def test_only_final_stage_is_used():
+    config = parse_dockerfile(
+        'FROM golang AS build\n'
+        'ENV CGO_ENABLED=0\n'
+        'VOLUME /cache\n'
+        'EXPOSE 9999\n'
+        'CMD ["go", "test"]\n'
+        'FROM alpine\n'
+        'EXPOSE 8080\n'
+    )
+    assert config['base_image'] == 'alpine'
+    assert config['ports'] == [8080]
+    assert config['env_vars'] == []
+    assert config['volumes'] == []
+    assert config['command'] is None
+    assert config['args'] is None
+
+
+def test_final_stage_inherits_from_named_stage():
+    config = parse_dockerfile(
+        'FROM mcr.microsoft.com/dotnet/aspnet:8.0 AS base\n'
+        'WORKDIR /app\n'
+        'EXPOSE 8080\n'
+        'ENV ASPNETCORE_URLS=http://+:8080\n'
+        'FROM mcr.microsoft.com/dotnet/sdk:8.0 AS build\n'
+        'ENV DOTNET_CLI_TELEMETRY_OPTOUT=1\n'
+        'EXPOSE 9999\n'
+        'FROM BASE AS final\n'
+        'ENTRYPOINT ["dotnet", "App.dll"]\n'
+    )
+    assert config['base_image'] == 'mcr.microsoft.com/dotnet/aspnet:8.0'
+    assert config['ports'] == [8080]
+    assert config['env_vars'] == [{'name': 'ASPNETCORE_URLS', 'value': 'http://+:8080'}]
+    assert config['command'] == ['dotnet', 'App.dll']
+
+
+def test_redefined_env_var_replaces_earlier_value():
+    config = parse_dockerfile('FROM alpine AS base\nENV A=1\nFROM base\nENV A=2\n')
+    assert config['env_vars'] == [{'name': 'A', 'value': '2'}]
+
+
+def test_entrypoint_is_command_and_cmd_is_args():
+    config = parse_dockerfile(
+        'FROM nginx\n'
+        'ENTRYPOINT ["nginx"]\n'
+        'CMD ["-g", "daemon off;"]\n'
+    )
+    assert config['command'] == ['nginx']
+    assert config['args'] == ['-g', 'daemon off;']
+
+
+def test_cmd_only_keeps_image_entrypoint():
+    config = parse_dockerfile('FROM nginx\nCMD ["nginx", "-g", "daemon off;"]\n')
+    assert config['command'] is None
+    assert config['args'] == ['nginx', '-g', 'daemon off;']
+
+
+def test_entrypoint_resets_inherited_cmd():
+    config = parse_dockerfile(
+        'FROM python AS base\n'
+        'CMD ["python"]\n'
+        'FROM base\n'
+        'ENTRYPOINT ["gunicorn", "app:app"]\n'
+    )
+    assert config['command'] == ['gunicorn', 'app:app']
+    assert config['args'] is None
+
+
+def test_shell_entrypoint_ignores_cmd():
+    config = parse_dockerfile(
+        'FROM python\n'
+        'ENTRYPOINT python app.py\n'
+        'CMD ["--port", "80"]\n'
+    )
+    assert config['command'] == ['/bin/sh', '-c', 'python app.py']
+    assert config['args'] is None
+
+
+def test_comment_inside_continuation_is_dropped():
+    config = parse_dockerfile(
+        'FROM alpine\n'
+        'ENV A=1 \\\n'
+        '# comment\n'
+        '    B=2\n'
+    )
+    assert config['env_vars'] == [
+        {'name': 'A', 'value': '1'},
+        {'name': 'B', 'value': '2'},
+    ]
+
+
+def test_env_forms():
+    config = parse_dockerfile(
+        'FROM alpine\n'
+        'ENV LEGACY some value\n'
+        'ENV QUOTED="two words"\n'
+    )
+    assert config['env_vars'] == [
+        {'name': 'LEGACY', 'value': 'some value'},
+        {'name': 'QUOTED', 'value': 'two words'},
+    ]
+
+
+def test_duplicate_exposed_ports_are_merged():
+    config = parse_dockerfile('FROM nginx\nEXPOSE 80 80/udp\nEXPOSE 443/tcp 80\n')
+    assert config['ports'] == [80, 443]
+
+
+def test_is_dockerfile_accepts_bom():
+    assert is_dockerfile('Dockerfile', b'\xef\xbb\xbfFROM alpine\n')
+
+
+def test_is_dockerfile_accepts_lowercase_instruction():
+    assert is_dockerfile('dockerfile', b'# base image\n  from alpine\n')
+
+
+def test_is_dockerfile_rejects_keyword_mid_line():
+    assert not is_dockerfile('Dockerfile', b'this file says FROM alpine\n')
+
+
+def test_is_dockerfile_rejects_wrong_name():
+    assert not is_dockerfile('Dockerfile.txt', b'FROM alpine\n')
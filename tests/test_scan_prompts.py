@@ -0,0 +1,41 @@
+import pytest
+
+from scan_prompts import BATCH_SCAN_PROMPT_PREFIX, build_batch_scan_prompt, split_batch_reports
+
+
+def test_batch_prompt_labels_each_file():
+    prompt = build_batch_scan_prompt([('Dockerfile', 'FROM alpine'), ('app.yaml', 'a: 1')])
+    assert prompt.startswith(BATCH_SCAN_PROMPT_PREFIX)
+    assert '===FILE 0: Dockerfile===\nFROM alpine' in prompt
+    assert '===FILE 1: app.yaml===\na: 1' in prompt
+
+
+def test_reports_are_split_in_order():
+    text = 'Here you go:\n===REPORT 0===\nFirst\n===REPORT 1===\nSecond\n'
+    assert split_batch_reports(text, 2) == ['First', 'Second']
+
+
+def test_reordered_reports_follow_their_index():
+    text = '===REPORT 1===\nSecond\n===REPORT 0===\nFirst\n'
+    assert split_batch_reports(text, 2) == ['First', 'Second']
+
+
+def test_duplicate_index_is_rejected():
+    with pytest.raises(ValueError):
+        split_batch_reports('===REPORT 0===\nA\n===REPORT 0===\nB\n', 2)
+
+
+def test_out_of_range_index_is_rejected():
+    with pytest.raises(ValueError):
+        split_batch_reports('===REPORT 1===\nA\n===REPORT 2===\nB\n', 2)
+
+
+def test_missing_report_is_rejected():
+    with pytest.raises(ValueError):
+        split_batch_reports('===REPORT 0===\nA\n', 2)
+
+
+def test_preamble_only_response():
+    assert split_batch_reports('  Whole report  \n', 1) == ['Whole report']
+    with pytest.raises(ValueError):
+        split_batch_reports('Sorry, I can only review one file.', 2)